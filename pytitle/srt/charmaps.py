@@ -0,0 +1,22 @@
+# translation tables for str.translate, every table replaces all of its
+# characters in a single pass over the text
+
+ARABIC_TO_PERSIAN = str.maketrans(
+    {
+        "ي": "ی",  # arabic yeh -> persian yeh
+        "ى": "ی",  # alef maksura -> persian yeh
+        "ك": "ک",  # arabic kaf -> persian keheh
+        "٠": "۰",  # arabic-indic digits -> persian digits
+        "١": "۱",
+        "٢": "۲",
+        "٣": "۳",
+        "٤": "۴",
+        "٥": "۵",
+        "٦": "۶",
+        "٧": "۷",
+        "٨": "۸",
+        "٩": "۹",
+    }
+)
+
+QUESTION_MARK = str.maketrans({"?": "؟"})  # ? -> arabic question mark
@@ -23,3 +23,12 @@ LINE = re.compile(
 ONE_LINER_RE = r"^\s*(\d+)\s*\n" + LINE_RE
 
 ONE_LINER = re.compile(ONE_LINER_RE, re.MULTILINE)
+
+ITALIC_RE = (
+    # group open: <i> with any spaces inside or the ass style {\i1}
+    r"(?P<open><\s*i\s*>|\{\\i1\})"
+    # group close: </i> with any spaces inside or the ass style {\i0}
+    r"|(?P<close><\s*/\s*i\s*>|\{\\i0\})"
+)
+
+ITALIC = re.compile(ITALIC_RE, re.IGNORECASE)
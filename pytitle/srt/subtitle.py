@@ -1,8 +1,12 @@
-from typing import List, Optional, Union
+import logging
+import mmap
+import re
+from functools import partial
+from typing import Callable, List, Optional, Tuple, Union, cast
 
 from pytitle.logger import get_logger
 
-from . import regex, exceptions
+from . import charmaps, regex, exceptions
 from .types import Line, PathType, Timestamp, Timing, Encodings
 
 logger = get_logger(__name__)
@@ -28,7 +32,6 @@ class SrtSubtitle:
         encoding: Optional[str] = "utf-8",
         use_chardet: bool = False,
         fallback_encodings: Encodings = Encodings(),
-        **kwargs,
     ) -> "SrtSubtitle":
         """Open subtitle file from a path
 
@@ -39,63 +42,201 @@ class SrtSubtitle:
         :param use_chardet: if True, use chardet to
             detect the encoding if 'utf-8' failed
         :type use_chardet: bool
+        :param fallback_encodings: the encodings to try in order
+            if ``encoding`` failed
+        :type fallback_encodings: Encodings
         :return: the subtitle object
         :rtype: SrtSubtitle
         """
-        with open(path, "r", encoding=encoding) as file:
+        encodings = [encoding or Encodings.UTF_8]
+        encodings += [
+            enc for enc in fallback_encodings.encodings if enc not in encodings
+        ]
+        filestring, encoding = cls._read_file(path, encodings)
+        if filestring is None:
+            logger.debug(f"Unable to detect encoding for file {path!r}")
+            if use_chardet:
+                logger.debug("Trying to use chardet to detect encoding")
+                # TODO: use chardet to detect encoding
+                raise NotImplementedError
+            raise exceptions.SrtEncodingDetectError(
+                f"Unable to detect encoding for {path!r}"
+            )
+        # the file is read in binary mode, translate the newlines once
+        filestring = filestring.replace("\r\n", "\n")
+        if "\r" in filestring:
+            filestring = filestring.replace("\r", "\n")
+        lines = cls.parse(filestring)
+        return cls(path=path, lines=lines, encoding=encoding)
+
+    @staticmethod
+    def _read_file(
+        path: PathType, encodings: List[str]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Read a file once and decode it with the first encoding that works
+
+        the file is read through a memory map and every encoding is
+        tried on the same buffer, the file is never read twice
+
+        :param path: the path to the file
+        :type path: str
+        :param encodings: the encodings to try in order
+        :type encodings: List[str]
+        :return: the decoded content of the file and its encoding,
+            (None, None) if none of the encodings worked
+        :rtype: Tuple[Optional[str], Optional[str]]
+        """
+        with open(path, "rb") as file:
+            data: Union[bytes, mmap.mmap]
             try:
-                filestring = file.read()
-            except UnicodeDecodeError:
-                logger.debug(
-                    f"Unable to decode file {path!r} with encoding"
-                    f" {encoding!r}, trying to detect the encoding"
-                )
-                enc_index = kwargs.get("enc_index", 0)
-                if encoding == "utf-8":
-                    # don't try the utf-8 again if its default
-                    enc_index += 1
-                encoding, enc_index = fallback_encodings.get_encoding(enc_index)
-                if encoding:
-                    return cls.open(path=path, encoding=encoding, enc_index=enc_index)
-                else:
-                    logger.debug(f"Unable to detect encoding for file {path!r}")
-                    if use_chardet:
-                        logger.debug("Trying to use chardet to detect encoding")
-                        # TODO: use chardet to detect encoding
-                        raise NotImplementedError
-                    raise exceptions.SrtEncodingDetectError(
-                        f"Unable to detect encoding for {path!r}"
-                    )
-            lines = cls.parse(filestring)
-            return cls(path=path, lines=lines, encoding=encoding)
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # empty files can't be mapped, neither can some file objects
+                data = file.read()
+            try:
+                for encoding in encodings:
+                    try:
+                        return str(data, encoding), encoding
+                    except UnicodeDecodeError:
+                        logger.debug(
+                            f"Unable to decode file {path!r} with encoding"
+                            f" {encoding!r}, trying the next encoding"
+                        )
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
+        return None, None
 
     @classmethod
     def parse(cls, filestring: str) -> List[Line]:
         """Parse the string formatted as a .srt file
 
+        regular subtitles are parsed block by block, the regex parser
+        is only used if a block doesn't have the expected layout
+
         :param filestring: the string of the subtitle file
         :type filestring: str
         :return: a list of Line objects
         :rtype: List[Line]
         """
-        lines = list()
-        for index, match in enumerate(
-            regex.LINE.finditer(filestring),
-            start=1,
-        ):
-            logger.debug(f"Parsing [index={index}]:")
+        lines = cls._parse_blocks(filestring)
+        if lines is None:
+            logger.debug("Irregular subtitle layout, falling back to regex parsing")
+            lines = cls._parse_regex(filestring)
+        logger.debug(f"Parsed {len(lines)} lines")
+        return lines
+
+    @classmethod
+    def _parse_blocks(cls, filestring: str) -> Optional[List[Line]]:
+        """Parse the string formatted as a .srt file with fixed offsets
+
+        every block should consist of an index line, a timing line in
+        the format of 00:00:00,000 --> 00:00:00,000 and the text lines,
+        separated from the next block by an empty line
+
+        :param filestring: the string of the subtitle file
+        :type filestring: str
+        :return: a list of Line objects, None if a block doesn't
+            have the expected layout
+        :rtype: Optional[List[Line]]
+        """
+        filestring = filestring.replace("\r\n", "\n").lstrip("\ufeff")
+        blocks = filestring.split("\n\n")
+        # every line takes one block, size the list once and trim it at the end
+        lines: List[Optional[Line]] = [None] * len(blocks)
+        count = 0
+        # bind the names used in the loop to locals
+        line_cls = Line
+        timing_cls = Timing
+        timestamp_cls = Timestamp
+        for block in blocks:
+            block = block.strip()
+            if "-->" not in block:
+                if not block or block.isdigit():
+                    # skip empty blocks and stray index lines
+                    continue
+                # text that isn't attached to a timing line
+                return None
+            nl1 = block.find("\n")
+            if nl1 == -1 or not block[:nl1].isdigit():
+                return None
+            nl2 = block.find("\n", nl1 + 1)
+            if nl2 == -1:
+                timing_line, text = block[nl1 + 1 :], ""
+            else:
+                timing_line, text = block[nl1 + 1 : nl2], block[nl2 + 1 :].strip()
+            timing_line = timing_line.strip()
+            if len(timing_line) != 29 or timing_line[12:17] != " --> ":
+                return None
+            if "-->" in text:
+                # missing empty line between two blocks
+                return None
+            start, end = timing_line[:12], timing_line[17:]
+            if start[2:9:3] != "::," or end[2:9:3] != "::,":
+                return None
+            # int() also accepts signs, underscores and spaces, regex.LINE doesn't
+            if not (
+                start[0:2] + start[3:5] + start[6:8] + start[9:12]
+                + end[0:2] + end[3:5] + end[6:8] + end[9:12]
+            ).isdigit():
+                return None
+            try:
+                timing = timing_cls(
+                    start=timestamp_cls(
+                        hours=int(start[0:2]),
+                        minutes=int(start[3:5]),
+                        seconds=int(start[6:8]),
+                        milliseconds=int(start[9:12]),
+                    ),
+                    end=timestamp_cls(
+                        hours=int(end[0:2]),
+                        minutes=int(end[3:5]),
+                        seconds=int(end[6:8]),
+                        milliseconds=int(end[9:12]),
+                    ),
+                )
+            except ValueError:
+                return None
+            lines[count] = line_cls(index=count + 1, timing=timing, text=text)
+            count += 1
+        del lines[count:]
+        return cast(List[Line], lines)
+
+    @classmethod
+    def _parse_regex(cls, filestring: str) -> List[Line]:
+        """Parse the string formatted as a .srt file with ``regex.LINE``
+
+        :param filestring: the string of the subtitle file
+        :type filestring: str
+        :return: a list of Line objects
+        :rtype: List[Line]
+        """
+        # every match has one arrow, size the list once and trim it at the end
+        lines: List[Optional[Line]] = [None] * filestring.count("-->")
+        count = 0
+        # bind the names used in the loop to locals
+        finditer = regex.LINE.finditer
+        timing_from_string = Timing.from_string
+        line_cls = Line
+        debug = logger.debug
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        for match in finditer(filestring):
+            index = count + 1
             start, end, text = match.groups()
-            timing = Timing.from_string(start, end)
-            logger.debug(f"\ttimestamp: {timing}")
+            timing = timing_from_string(start, end)
             text = text.strip()
-            logger.debug(f"\ttext: {repr(text)}")
-            line = Line(
+            if debug_enabled:
+                debug(f"Parsing [index={index}]:")
+                debug(f"\ttimestamp: {timing}")
+                debug(f"\ttext: {repr(text)}")
+            lines[count] = line_cls(
                 index=index,
                 timing=timing,
                 text=text,
             )
-            lines.append(line)
-        return lines
+            count = index
+        del lines[count:]
+        return cast(List[Line], lines)
 
     def save(
         self,
@@ -115,8 +256,16 @@ class SrtSubtitle:
         if path is None:
             raise exceptions.SrtSaveError("No path specified")
 
+        if self.lines is None:
+            raise ValueError("No lines to output")
+
         with open(path, "w+", encoding=encoding or self.encoding) as file:
-            file.write(self.output)
+            # write the lines one by one instead of building the whole output
+            separator = ""
+            for line in self.lines:
+                file.write(separator)
+                file.write(line.output)
+                separator = "\n"
 
     def shift(
         self,
@@ -149,8 +298,20 @@ class SrtSubtitle:
         if indexes is not None:
             lines = Line.get_lines(lines, indexes)
 
+        milliseconds = shift_by.total_milliseconds
+        if backward:
+            milliseconds = -milliseconds
+
+        # compute and check every new timestamp before changing any of them
+        # so a negative timestamp doesn't leave the subtitle half shifted
+        shifted = list()
         for line in lines:
-            line.timing.shift(shift_by, backward=backward, start=start, end=end)
+            timing = line.timing
+            new_start, new_end = timing.shifted(milliseconds, start=start, end=end)
+            shifted.append((timing, new_start, new_end))
+        for timing, new_start, new_end in shifted:
+            timing.start = new_start
+            timing.end = new_end
 
     def shift_forward(
         self,
@@ -183,7 +344,7 @@ class SrtSubtitle:
         """
         if isinstance(index, int):
             index = [index]
-        if all([hours == 0, minutes == 0, seconds == 0, milliseconds == 0]):
+        if not (hours or minutes or seconds or milliseconds):
             raise ValueError("No time specified")
         return self.shift(
             Timestamp(
@@ -222,7 +383,7 @@ class SrtSubtitle:
         :return: None
         :rtype: None
         """
-        if all([hours == 0, minutes == 0, seconds == 0, milliseconds == 0]):
+        if not (hours or minutes or seconds or milliseconds):
             raise ValueError("No time specified")
 
         if isinstance(index, int):
@@ -246,25 +407,98 @@ class SrtSubtitle:
         """Reindexes the subtitle lines by timing"""
         raise NotImplementedError
 
-    def remove_italic(self):
+    def remove_italic(self) -> None:
         """Remove italic tags from subtitle"""
-        raise NotImplementedError
+        self._fix_text(partial(regex.ITALIC.sub, ""))
 
-    def fix_italic(self):
-        """Fix italic tags from subtitle"""
-        raise NotImplementedError
+    def fix_italic(self) -> None:
+        """Fix italic tags from subtitle
 
-    def fix_arabic(self):
-        """Fix arabic/persian characters in subtitle"""
-        raise NotImplementedError
+        rewrites every italic tag as ``<i>`` or ``</i>``, drops the
+        tags that are opened twice or closed before being opened and
+        closes the tags that are left open at the end of a line
+        """
+        self._fix_text(self._fix_italic_text)
 
-    def fix_question_mark(self):
-        """Fix question marks for arabic/persian subtitles"""
-        raise NotImplementedError
+    @staticmethod
+    def _fix_italic_text(text: str) -> str:
+        """Fix the italic tags of a text with a single ``regex.ITALIC`` pass
+
+        :param text: the text to fix
+        :type text: str
+        :return: the fixed text
+        :rtype: str
+        """
+        is_open = False
+
+        def replace(match: re.Match) -> str:
+            nonlocal is_open
+            if match.lastgroup == "open":
+                if is_open:
+                    return ""
+                is_open = True
+                return "<i>"
+            if not is_open:
+                return ""
+            is_open = False
+            return "</i>"
+
+        text = regex.ITALIC.sub(replace, text)
+        if is_open:
+            text += "</i>"
+        return text
+
+    def fix_arabic(self) -> None:
+        """Fix arabic/persian characters in subtitle
+
+        replaces the arabic forms of the characters that have a
+        persian form, e.g. ``ي`` with ``ی`` and ``ك`` with ``ک``
+        """
+        self._fix_text(lambda text: text.translate(charmaps.ARABIC_TO_PERSIAN))
+
+    def fix_question_mark(self) -> None:
+        """Fix question marks for arabic/persian subtitles
+
+        replaces ``?`` with the arabic question mark ``؟``
+        """
+        self._fix_text(lambda text: text.translate(charmaps.QUESTION_MARK))
+
+    def _fix_text(self, fix: Callable[[str], str]) -> None:
+        """Replace the text of every line with the result of ``fix``
+
+        :param fix: the function to call with the text of each line
+        :type fix: Callable[[str], str]
+        :return: None
+        :rtype: None
+        """
+        if self.lines is None:
+            raise ValueError("No lines to fix")
+        for line in self.lines:
+            if line.text:
+                line.text = fix(line.text)
 
     def find_overlaps(self) -> List[Line]:
-        """Find overlapping lines in subtitle"""
-        raise NotImplementedError
+        """Find overlapping lines in subtitle
+
+        the lines are sorted by their start and swept once, a line
+        overlaps if it starts before one of the lines before it ends
+
+        :return: the lines that start before an earlier line has ended
+        :rtype: List[Line]
+        """
+        if self.lines is None:
+            raise ValueError("No lines to check")
+        # sorting the usually already sorted lines is a single linear pass
+        lines = sorted(
+            self.lines, key=lambda line: line.timing.start.total_milliseconds
+        )
+        overlaps = list()
+        last_end = -1
+        for line in lines:
+            if line.timing.start.total_milliseconds < last_end:
+                overlaps.append(line)
+            last_end = max(last_end, line.timing.end.total_milliseconds)
+        return overlaps
 
     def __repr__(self) -> str:
         lines = len(self.lines) if self.lines is not None else 0
@@ -276,6 +510,9 @@ class SrtSubtitle:
 
     @property
     def output(self) -> str:
+        """output the subtitle in .srt format"""
         if self.lines is None:
             raise ValueError("No lines to output")
-        return "\n".join(line.output for line in self.lines)
+        # Line.output ends with a newline, joining with another one
+        # leaves the empty line between the blocks
+        return "\n".join([line.output for line in self.lines])
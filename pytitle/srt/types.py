@@ -148,6 +148,36 @@ class Timestamp(BaseModel):
             f"{self.get_value('seconds')},{self.get_value('milliseconds')}"
         )
 
+    @property
+    def total_milliseconds(self) -> int:
+        """the whole timestamp in milliseconds"""
+        return (
+            (self.hours * 60 + self.minutes) * 60 + self.seconds
+        ) * 1000 + self.milliseconds
+
+    @classmethod
+    def from_milliseconds(cls, milliseconds: int) -> "Timestamp":
+        """Create a Timestamp object from a number of milliseconds
+
+        :param milliseconds: the whole timestamp in milliseconds
+        :type milliseconds: int
+        :return: the Timestamp object
+        :rtype: Timestamp
+        """
+        if milliseconds < 0:
+            raise exceptions.NegativeTimestampError(
+                "Timestamp can not have a negative value"
+            )
+        seconds, milliseconds = divmod(milliseconds, 1000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return cls(
+            hours=hours,
+            minutes=minutes,
+            seconds=seconds,
+            milliseconds=milliseconds,
+        )
+
     @classmethod
     def from_string(cls, timestr: str) -> "Timestamp":
         """Create a Timestamp object from a string
@@ -271,18 +301,62 @@ class Timing(BaseModel):
         :return: None
         :rtype: None
         """
-        if all([not start, not end]):
-            raise ValueError("At least one of start or end must be True")
+        milliseconds = shift_by.total_milliseconds
         if backward:
-            if start:
-                self.start -= shift_by
-            if end:
-                self.end -= shift_by
-        else:
-            if start:
-                self.start += shift_by
-            if end:
-                self.end += shift_by
+            milliseconds = -milliseconds
+        self.shift_milliseconds(milliseconds, start=start, end=end)
+
+    def shift_milliseconds(
+        self,
+        milliseconds: int,
+        start: bool = True,
+        end: bool = True,
+    ) -> None:
+        """Shift the timing by a number of milliseconds
+
+        :param milliseconds: the milliseconds to shift the timing by,
+            a negative value shifts the timing backward
+        :type milliseconds: int
+        :param start: shift the start Timestamp
+        :type start: bool
+        :param end: shift the end Timestamp
+        :type end: bool
+        :return: None
+        :rtype: None
+        """
+        self.start, self.end = self.shifted(milliseconds, start=start, end=end)
+
+    def shifted(
+        self,
+        milliseconds: int,
+        start: bool = True,
+        end: bool = True,
+    ) -> Tuple[Timestamp, Timestamp]:
+        """Get the shifted start and end Timestamps without changing the timing
+
+        :param milliseconds: the milliseconds to shift the timing by,
+            a negative value shifts the timing backward
+        :type milliseconds: int
+        :param start: shift the start Timestamp
+        :type start: bool
+        :param end: shift the end Timestamp
+        :type end: bool
+        :return: the new start and end Timestamps
+        :rtype: Tuple[Timestamp, Timestamp]
+        """
+        if not (start or end):
+            raise ValueError("At least one of start or end must be True")
+        new_start = self.start
+        if start:
+            new_start = Timestamp.from_milliseconds(
+                new_start.total_milliseconds + milliseconds
+            )
+        new_end = self.end
+        if end:
+            new_end = Timestamp.from_milliseconds(
+                new_end.total_milliseconds + milliseconds
+            )
+        return new_start, new_end
 
 
 class Line(BaseModel):
@@ -350,7 +424,9 @@ class Line(BaseModel):
         :return: the lines
         :rtype: List[Line]
         """
-        lines = [line for line in lines if line.index in set(index)]
+        # build the set once, not for every line
+        indexes = set(index)
+        lines = [line for line in lines if line.index in indexes]
         if check_contains and len(lines) != len(index):
             raise IndexError(
                 f"{index} contains lines that do not exist in the subtitle"
@@ -381,20 +457,3 @@ class Encodings:
                 for key, val in type(self).__dict__.items()
                 if not (key.startswith("_") or callable(val))
             ]
-
-    def get_encoding(self, index: int) -> Tuple[Optional[str], Optional[int]]:
-        """
-        Get encoding by index.
-
-        :param index: the index of the encoding
-        :type index: int
-        :return: the encoding and the index of the next encoding
-        :rtype: Tuple[Optional[Encoding], Optional[int]]
-        """
-        if index is None:
-            return None, None
-        try:
-            encoding = self.encodings[index]
-        except IndexError:
-            return None, None
-        return encoding, index + 1
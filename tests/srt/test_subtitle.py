@@ -199,3 +199,153 @@ def test_srt_shift_backward_index():
     assert sub.lines[0].timing.end == Timestamp(
         hours=0, minutes=2, seconds=20, milliseconds=321
     )
+
+
+def test_srt_parse_blocks_matches_regex():
+    path = os.path.join(subtitles_dir, "Grown Ups.2010.R5.LiNE.Xvid {1337x}-Noir.srt")
+    with open(path, "r", encoding="cp1256") as file:
+        filestring = file.read()
+    lines = SrtSubtitle._parse_blocks(filestring)
+    assert lines is not None
+    assert lines == SrtSubtitle._parse_regex(filestring)
+
+
+def test_srt_parse_irregular_layout():
+    filestring = (
+        "1\n00:00:01,000 --> 00:00:02,000\n\n\nFirst line\n\n\n"
+        "00:00:03,000 --> 00:00:04,000\nSecond line\n"
+    )
+    assert SrtSubtitle._parse_blocks(filestring) is None
+    lines = SrtSubtitle.parse(filestring)
+    assert len(lines) == 2
+    assert lines[0].text == "First line"
+    assert lines[1].index == 2
+
+
+def test_srt_parse_blocks_stray_index():
+    filestring = (
+        "1\n00:00:01,000 --> 00:00:02,000\nFirst line\n\n2\n\n\n"
+        "3\n00:00:03,000 --> 00:00:04,000\nSecond line\n"
+    )
+    lines = SrtSubtitle._parse_blocks(filestring)
+    assert lines is not None
+    assert [line.text for line in lines] == ["First line", "Second line"]
+
+
+def test_srt_shift_negative_leaves_lines_untouched():
+    lines = copy.deepcopy(sample_lines)
+    lines[3].timing.start = Timestamp(seconds=5)
+    sub = SrtSubtitle(lines=lines)
+    with pytest.raises(exceptions.NegativeTimestampError):
+        sub.shift_backward(seconds=10)
+    assert sub.lines[0].timing.start == Timestamp(
+        hours=0, minutes=2, seconds=12, milliseconds=455
+    )
+    assert sub.lines[3].timing.start == Timestamp(seconds=5)
+
+
+def test_srt_open_empty_file(tmpdir):
+    path = tmpdir.join("empty.srt")
+    path.write("")
+    sub = SrtSubtitle.open(path)
+    assert sub.lines == []
+
+
+def test_srt_output_after_in_place_edit():
+    sub = SrtSubtitle(lines=copy.deepcopy(sample_lines))
+    output = sub.output
+    sub.lines[0].text = "EDITED"
+    sub.lines[1].timing.shift(Timestamp(seconds=10))
+    sub.lines.append(copy.deepcopy(sample_lines[0]))
+    assert sub.output != output
+    assert sub.output.startswith("1\n00:02:12,455 --> 00:02:30,321\nEDITED\n")
+    assert "2\n00:02:45,455 --> 00:03:08,321\n" in sub.output
+    assert sub.output.endswith(sample_lines[0].output)
+
+
+def test_srt_save_matches_output(tmpdir):
+    sub = SrtSubtitle(lines=copy.deepcopy(sample_lines))
+    sub.lines[0].text = "EDITED"
+    sub.save(path=tmpdir.join("edited.srt"))
+    assert tmpdir.join("edited.srt").read() == sub.output
+
+
+def test_srt_parse_custom_fallback_encodings():
+    path = os.path.join(subtitles_dir, "Grown Ups.2010.R5.LiNE.Xvid {1337x}-Noir.srt")
+    sub = SrtSubtitle.open(path, fallback_encodings=Encodings(["utf-8", "cp1256"]))
+    assert sub.encoding == "cp1256"
+    assert len(sub.lines) == 1373
+
+
+def test_srt_fix_arabic():
+    lines = copy.deepcopy(sample_lines[:2])
+    lines[0].text = "كتاب يك"
+    lines[1].text = "١٢"
+    sub = SrtSubtitle(lines=lines)
+    sub.fix_arabic()
+    assert sub.lines[0].text == "کتاب یک"
+    assert sub.lines[1].text == "۱۲"
+
+
+def test_srt_fix_question_mark():
+    sub = SrtSubtitle(lines=copy.deepcopy(sample_lines))
+    sub.lines[0].text = "چرا?"
+    output = sub.output
+    sub.fix_question_mark()
+    assert sub.lines[0].text == "چرا؟"
+    assert sub.output != output
+
+
+def test_srt_fix_no_lines():
+    with pytest.raises(ValueError):
+        SrtSubtitle().fix_arabic()
+
+
+def test_srt_remove_italic():
+    sub = SrtSubtitle(lines=copy.deepcopy(sample_lines[:2]))
+    sub.lines[0].text = "<i>Hello</i> from {\\i1}First{\\i0} line!"
+    sub.lines[1].text = "< I >Hello from Second line!</ i>"
+    sub.remove_italic()
+    assert sub.lines[0].text == "Hello from First line!"
+    assert sub.lines[1].text == "Hello from Second line!"
+
+
+def test_srt_fix_italic():
+    sub = SrtSubtitle(lines=copy.deepcopy(sample_lines[:3]))
+    sub.lines[0].text = "< I >Hello</ i> from {\\i1}First{\\i0} line!"
+    sub.lines[1].text = "</i>Hello <i>from <i>Second line!"
+    sub.fix_italic()
+    assert sub.lines[0].text == "<i>Hello</i> from <i>First</i> line!"
+    assert sub.lines[1].text == "Hello <i>from Second line!</i>"
+    assert sub.lines[2].text == "Hello from Third line!"
+
+
+def test_srt_find_overlaps():
+    lines = copy.deepcopy(sample_lines)
+    sub = SrtSubtitle(lines=lines)
+    assert sub.find_overlaps() == []
+    # the first line now ends after the second and third lines start
+    lines[0].timing.end = Timestamp(minutes=3, seconds=10)
+    assert sub.find_overlaps() == [lines[1], lines[2]]
+
+
+def test_srt_parse_regex_arrow_in_text():
+    filestring = (
+        "00:00:01,000 --> 00:00:02,000\nFirst line -->\n\n"
+        "00:00:03,000 ---> 00:00:04,000\nSecond line\n"
+    )
+    lines = SrtSubtitle._parse_regex(filestring)
+    assert [line.text for line in lines] == ["First line -->", "Second line"]
+    assert SrtSubtitle._parse_regex("") == []
+
+
+@pytest.mark.parametrize(
+    "timing_line",
+    [
+        "+0:00:01,000 --> 00:00:02,000",
+        "00:00:01,0_0 --> 00:00:02,000",
+        "00:00:01,000 --> 00: 1:02,000",
+    ],
+)
+def test_srt_parse_blocks_non_digit_timestamp(timing_line):
+    assert SrtSubtitle._parse_blocks(f"1\n{timing_line}\nFirst line\n") is None
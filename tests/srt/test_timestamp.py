@@ -209,3 +209,12 @@ def test_timestamp_get_value():
     assert timestamp.get_value("milliseconds") == "456"
     with pytest.raises(ValueError):
         timestamp.get_value("foo")
+
+
+def test_timestamp_total_milliseconds():
+    timestamp = Timestamp(hours=1, minutes=2, seconds=3, milliseconds=456)
+    assert timestamp.total_milliseconds == 3723456
+    assert Timestamp.from_milliseconds(3723456) == timestamp
+    assert Timestamp.from_milliseconds(0) == Timestamp()
+    with pytest.raises(exceptions.NegativeTimestampError):
+        Timestamp.from_milliseconds(-1)
@@ -72,3 +72,13 @@ def test_timing_shift_start_and_end_none():
     )
     with pytest.raises(ValueError):
         t.shift(Timestamp(seconds=10), start=False, end=False)
+
+
+def test_timing_shift_milliseconds():
+    t = Timing(
+        start=Timestamp(hours=1, minutes=2, seconds=3, milliseconds=456),
+        end=Timestamp(hours=1, minutes=2, seconds=4, milliseconds=567),
+    )
+    t.shift_milliseconds(-3500, end=False)
+    assert t.start == Timestamp(hours=1, minutes=1, seconds=59, milliseconds=956)
+    assert t.end == Timestamp(hours=1, minutes=2, seconds=4, milliseconds=567)